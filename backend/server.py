@@ -1,32 +1,33 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Form, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.responses import FileResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+from collections import OrderedDict
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 import uuid
 from datetime import datetime, timedelta
 import bcrypt
 import jwt
 import json
 import aiofiles
+import asyncio
+import math
+import time
 from enum import Enum
 
-ROOT_DIR = Path(__file__).parent
-load_dotenv(ROOT_DIR / '.env')
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+ROOT_DIR = Path(__file__).parent
 
-# Create the main app without a prefix
-app = FastAPI(title="MCSA Highveld Ridge Circuit 1021 Management System")
+logger = logging.getLogger(__name__)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -39,9 +40,8 @@ JWT_EXPIRATION_HOURS = 24
 # Security
 security = HTTPBearer()
 
-# File upload directory
+# File upload directory, created on startup
 UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
 
 # User Roles
 class UserRole(str, Enum):
@@ -181,7 +181,14 @@ def create_jwt_token(user_id: str, username: str, role: str) -> str:
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+def get_db(request: Request) -> "AsyncIOMotorDatabase":
+    # MongoDB connection, opened by the lifespan handler
+    return request.app.state.db
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     try:
         payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         user_id = payload.get("user_id")
@@ -201,11 +208,133 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except jwt.JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Rate limiting
+class RateLimit(BaseModel):
+    capacity: int
+    refill_per_second: float
+    # Only charged once the handler reports a failed attempt, e.g. a wrong password
+    failures_only: bool = False
+
+# Per-route token buckets by scope: "ip" is the client IP, "username" the username
+# field of the JSON body. Override per route with RATE_LIMITS in the environment, e.g.
+# RATE_LIMITS='{"auth/register": {"ip": {"capacity": 10, "refill_per_second": 0.5}}}'
+DEFAULT_RATE_LIMITS: Dict[str, Dict[str, RateLimit]] = {
+    "auth/login": {
+        "ip": RateLimit(capacity=20, refill_per_second=20 / 60),
+        "username": RateLimit(capacity=10, refill_per_second=10 / 300, failures_only=True),
+    },
+    "auth/register": {
+        "ip": RateLimit(capacity=5, refill_per_second=5 / 60),
+    },
+}
+
+def load_rate_limits() -> Dict[str, Dict[str, RateLimit]]:
+    limits = dict(DEFAULT_RATE_LIMITS)
+    overrides = json.loads(os.environ.get("RATE_LIMITS", "{}"))
+    for route, scopes in overrides.items():
+        limits[route] = {scope: RateLimit(**limit) for scope, limit in scopes.items()}
+    return limits
+
+class InMemoryRateLimitStore:
+    """Token buckets held in this process; replace with a shared store when running several workers"""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # Least recently used first, so eviction is a single popitem
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def _level(self, key: str, limit: RateLimit, now: float) -> float:
+        tokens, updated_at = self._buckets.get(key, (limit.capacity, now))
+        return min(limit.capacity, tokens + (now - updated_at) * limit.refill_per_second)
+
+    def _store(self, key: str, tokens: float, now: float):
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+    async def acquire(
+        self,
+        buckets: List[Tuple[str, RateLimit]],
+        check_only: Optional[List[Tuple[str, RateLimit]]] = None
+    ) -> float:
+        """Check every bucket has a token and take one from each of buckets.
+
+        Returns 0 if allowed, otherwise seconds until all buckets have a token.
+        Rejected requests leave the store untouched.
+        """
+        now = time.monotonic()
+        levels = []
+        retry_after = 0
+        for key, limit in buckets + (check_only or []):
+            tokens = self._level(key, limit, now)
+            if tokens < 1:
+                retry_after = max(retry_after, (1 - tokens) / limit.refill_per_second)
+            levels.append((key, tokens))
+
+        if retry_after:
+            return retry_after
+
+        for key, tokens in levels[:len(buckets)]:
+            self._store(key, tokens - 1, now)
+        return 0
+
+    async def consume(self, buckets: List[Tuple[str, RateLimit]]):
+        """Take one token from each bucket unconditionally"""
+        now = time.monotonic()
+        for key, limit in buckets:
+            # Concurrent failures may overdraw; the bucket then takes longer to refill
+            self._store(key, self._level(key, limit, now) - 1, now)
+
+class RateLimitTicket:
+    def __init__(self, store: InMemoryRateLimitStore, failure_buckets: List[Tuple[str, RateLimit]]):
+        self.store = store
+        self.failure_buckets = failure_buckets
+
+    async def record_failure(self):
+        await self.store.consume(self.failure_buckets)
+
+def rate_limit(route: str):
+    """Dependency that throttles a route by its RATE_LIMITS entry before the handler runs"""
+    async def dependency(request: Request) -> RateLimitTicket:
+        limits = request.app.state.rate_limits.get(route, {})
+        store = request.app.state.rate_limit_store
+
+        keys = {"ip": request.client.host if request.client else "unknown"}
+        if "username" in limits:
+            try:
+                body = await request.json()
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and body.get("username") is not None:
+                keys["username"] = str(body["username"])
+
+        buckets, failure_buckets = [], []
+        for scope, limit in limits.items():
+            if scope in keys:
+                bucket = (f"{route}:{scope}:{keys[scope]}", limit)
+                (failure_buckets if limit.failures_only else buckets).append(bucket)
+
+        retry_after = await store.acquire(buckets, check_only=failure_buckets)
+        if retry_after:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests",
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+        return RateLimitTicket(store, failure_buckets)
+    return dependency
+
 # Authentication Routes
 @api_router.post("/auth/login")
-async def login(user_login: UserLogin):
+async def login(
+    user_login: UserLogin,
+    throttle: RateLimitTicket = Depends(rate_limit("auth/login")),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     user = await db.users.find_one({"username": user_login.username})
-    if not user or not verify_password(user_login.password, user["password_hash"]):
+    if not user or not await run_in_threadpool(verify_password, user_login.password, user["password_hash"]):
+        await throttle.record_failure()
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     if not user.get("is_active"):
@@ -225,8 +354,11 @@ async def login(user_login: UserLogin):
         }
     }
 
-@api_router.post("/auth/register")
-async def register(user_create: UserCreate):
+@api_router.post("/auth/register", dependencies=[Depends(rate_limit("auth/register"))])
+async def register(
+    user_create: UserCreate,
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     # Check if username exists
     existing_user = await db.users.find_one({"username": user_create.username})
     if existing_user:
@@ -234,7 +366,7 @@ async def register(user_create: UserCreate):
     
     # Create user
     user_dict = user_create.dict()
-    user_dict["password_hash"] = hash_password(user_create.password)
+    user_dict["password_hash"] = await run_in_threadpool(hash_password, user_create.password)
     del user_dict["password"]
     
     user = User(**user_dict)
@@ -248,7 +380,11 @@ async def get_me(current_user: User = Depends(get_current_user)):
 
 # Members Routes
 @api_router.post("/members", response_model=Member)
-async def create_member(member_create: MemberCreate, current_user: User = Depends(get_current_user)):
+async def create_member(
+    member_create: MemberCreate,
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     member_dict = member_create.dict()
     member_dict["created_by"] = current_user.id
     member = Member(**member_dict)
@@ -259,7 +395,8 @@ async def create_member(member_create: MemberCreate, current_user: User = Depend
 async def get_members(
     society: Optional[Society] = None,
     search: Optional[str] = None,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
 ):
     query = {}
     if society:
@@ -274,7 +411,11 @@ async def get_members(
     return [Member(**member) for member in members]
 
 @api_router.get("/members/{member_id}", response_model=Member)
-async def get_member(member_id: str, current_user: User = Depends(get_current_user)):
+async def get_member(
+    member_id: str,
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     member = await db.members.find_one({"id": member_id})
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
@@ -284,7 +425,8 @@ async def get_member(member_id: str, current_user: User = Depends(get_current_us
 async def update_member(
     member_id: str, 
     member_update: MemberCreate, 
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
 ):
     existing_member = await db.members.find_one({"id": member_id})
     if not existing_member:
@@ -297,7 +439,11 @@ async def update_member(
     return Member(**updated_member)
 
 @api_router.delete("/members/{member_id}")
-async def delete_member(member_id: str, current_user: User = Depends(get_current_user)):
+async def delete_member(
+    member_id: str,
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     result = await db.members.delete_one({"id": member_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Member not found")
@@ -307,7 +453,8 @@ async def delete_member(member_id: str, current_user: User = Depends(get_current
 @api_router.post("/finances", response_model=FinancialEntry)
 async def create_financial_entry(
     entry_create: FinancialEntryCreate, 
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
 ):
     entry_dict = entry_create.dict()
     entry_dict["created_by"] = current_user.id
@@ -327,7 +474,8 @@ async def get_financial_entries(
     society: Optional[Society] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
 ):
     query = {}
     if society:
@@ -347,7 +495,8 @@ async def get_financial_entries(
 @api_router.post("/announcements", response_model=Announcement)
 async def create_announcement(
     announcement_create: AnnouncementCreate, 
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
 ):
     announcement_dict = announcement_create.dict()
     announcement_dict["created_by"] = current_user.id
@@ -356,40 +505,87 @@ async def create_announcement(
     return announcement
 
 @api_router.get("/announcements", response_model=List[Announcement])
-async def get_announcements(current_user: User = Depends(get_current_user)):
+async def get_announcements(
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     announcements = await db.announcements.find().sort("created_at", -1).to_list(100)
     return [Announcement(**announcement) for announcement in announcements]
 
 # Statistics Routes
-@api_router.get("/stats/dashboard")
-async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
-    total_members = await db.members.count_documents({})
-    total_societies = len(Society)
-    total_organizations = len(Organization)
-    
-    # Recent financial entries
-    recent_finances = await db.financial_entries.find().sort("created_at", -1).limit(5).to_list(5)
-    
+async def compute_dashboard_stats(db: "AsyncIOMotorDatabase"):
+    (
+        total_members,
+        society_counts,
+        recent_finances
+    ) = await asyncio.gather(
+        db.members.count_documents({}),
+        db.members.aggregate([
+            {"$match": {"society": {"$in": [society.value for society in Society]}}},
+            {"$group": {"_id": "$society", "count": {"$sum": 1}}}
+        ]).to_list(None),
+        db.financial_entries.find({}, {"_id": 0}).sort("created_at", -1).limit(5).to_list(5)
+    )
+
     # Members by society
-    members_by_society = {}
-    for society in Society:
-        count = await db.members.count_documents({"society": society})
-        members_by_society[society] = count
-    
+    members_by_society = {society.value: 0 for society in Society}
+    for row in society_counts:
+        members_by_society[row["_id"]] = row["count"]
+
     return {
         "total_members": total_members,
-        "total_societies": total_societies,
-        "total_organizations": total_organizations,
+        "total_societies": len(Society),
+        "total_organizations": len(Organization),
         "recent_finances": recent_finances,
         "members_by_society": members_by_society
     }
 
+@api_router.get("/stats/dashboard")
+async def get_dashboard_stats(
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
+    return await compute_dashboard_stats(db)
+
+# Bootstrap Route
+# Field projections for the bootstrap payload; only what the initial views render
+MEMBER_SUMMARY_FIELDS = {
+    "_id": 0, "id": 1, "title": 1, "full_name": 1, "email_address": 1,
+    "society": 1, "gender": 1, "occupation": 1
+}
+FINANCE_SUMMARY_FIELDS = {
+    "_id": 0, "id": 1, "society": 1, "date": 1, "pledges": 1,
+    "special_effort": 1, "sunday_collection": 1, "total": 1
+}
+ANNOUNCEMENT_SUMMARY_FIELDS = {"_id": 0, "created_by": 0}
+
+@api_router.get("/bootstrap")
+async def get_bootstrap(
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
+    stats, members, finances, announcements = await asyncio.gather(
+        compute_dashboard_stats(db),
+        db.members.find({}, MEMBER_SUMMARY_FIELDS).to_list(1000),
+        db.financial_entries.find({}, FINANCE_SUMMARY_FIELDS).sort("date", -1).to_list(1000),
+        db.announcements.find({}, ANNOUNCEMENT_SUMMARY_FIELDS).sort("created_at", -1).to_list(100)
+    )
+
+    return {
+        "user": current_user.dict(exclude={"password_hash"}),
+        "stats": stats,
+        "members": members,
+        "finances": finances,
+        "announcements": announcements
+    }
+
 # File Upload Routes
 @api_router.post("/upload")
 async def upload_file(
     file: UploadFile = File(...),
     category: str = Form(...),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
 ):
     # Create category directory
     category_dir = UPLOAD_DIR / category
@@ -420,42 +616,67 @@ async def upload_file(
     return {"message": "File uploaded successfully", "file_id": file_info["id"]}
 
 @api_router.get("/files/{category}")
-async def get_files_by_category(category: str, current_user: User = Depends(get_current_user)):
+async def get_files_by_category(
+    category: str,
+    current_user: User = Depends(get_current_user),
+    db: "AsyncIOMotorDatabase" = Depends(get_db)
+):
     files = await db.files.find({"category": category}).sort("uploaded_at", -1).to_list(100)
     return files
 
 # Initialize default admin user
-@app.on_event("startup")
-async def create_default_admin():
+async def create_default_admin(db: "AsyncIOMotorDatabase"):
     admin_exists = await db.users.find_one({"username": "admin"})
     if not admin_exists:
         admin_user = User(
             username="admin",
-            password_hash=hash_password("admin123"),
+            password_hash=await run_in_threadpool(hash_password, "admin123"),
             full_name="System Administrator",
             role=UserRole.ADMIN
         )
         await db.users.insert_one(admin_user.dict())
         print("Default admin user created: username=admin, password=admin123")
 
-# Include the router in the main app
-app.include_router(api_router)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    load_dotenv(ROOT_DIR / '.env')
+
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    UPLOAD_DIR.mkdir(exist_ok=True)
+    app.state.rate_limits = load_rate_limits()
+
+    # Motor pulls in pymongo and its bson extensions, so import it on first startup
+    from motor.motor_asyncio import AsyncIOMotorClient
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    app.state.client = client
+    app.state.db = client[os.environ['DB_NAME']]
+
+    try:
+        await create_default_admin(app.state.db)
+        yield
+    finally:
+        client.close()
+
+def create_app(rate_limit_store: Optional[InMemoryRateLimitStore] = None) -> FastAPI:
+    # Create the main app without a prefix
+    app = FastAPI(title="MCSA Highveld Ridge Circuit 1021 Management System", lifespan=lifespan)
+    app.state.rate_limit_store = rate_limit_store or InMemoryRateLimitStore()
+
+    # Include the router in the main app
+    app.include_router(api_router)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_credentials=True,
+        allow_origins=["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    return app
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+app = create_app()
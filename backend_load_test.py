@@ -0,0 +1,167 @@
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+BACKEND_DIR = Path(__file__).parent / "backend"
+
+# Every route with no scopes, i.e. the limiter switched off, for the control run
+NO_RATE_LIMITS = json.dumps({"auth/login": {}, "auth/register": {}})
+
+
+class LoginAttackLoadTester:
+    def __init__(self, attackers=20, attacker_ips=500, duration=10):
+        self.attackers = attackers
+        self.attacker_ips = attacker_ips
+        self.duration = duration
+        self.base_url = None
+        self.attack_statuses = {}
+        self._lock = threading.Lock()
+
+    def start_server(self, rate_limits=None):
+        """Launch uvicorn on a free port, optionally overriding RATE_LIMITS"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        env = os.environ.copy()
+        if rate_limits is not None:
+            env["RATE_LIMITS"] = rate_limits
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port)],
+            cwd=BACKEND_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env
+        )
+        self.base_url = f"http://127.0.0.1:{port}/api"
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError("uvicorn exited before serving a request")
+            try:
+                requests.get(f"{self.base_url}/auth/me", timeout=0.5)
+                return process
+            except requests.exceptions.ConnectionError:
+                time.sleep(0.05)
+
+    def create_legitimate_user(self):
+        """Register a separate account, since the attack locks admin out by design"""
+        # uvicorn trusts X-Forwarded-For from localhost, which lets one machine play several clients
+        headers = {"X-Forwarded-For": f"10.1.{uuid.uuid4().int % 256}.1"}
+        username = f"loadtest-{uuid.uuid4()}"
+        requests.post(
+            f"{self.base_url}/auth/register",
+            json={
+                "username": username,
+                "password": "loadtest123",
+                "full_name": "Load Test User",
+                "role": "secretary"
+            },
+            headers=headers
+        ).raise_for_status()
+        return username, headers
+
+    def legitimate_session(self, username, headers, samples=20):
+        """Log in and browse, returning per-request latencies in seconds"""
+        start = time.perf_counter()
+        response = requests.post(
+            f"{self.base_url}/auth/login",
+            json={"username": username, "password": "loadtest123"},
+            headers=headers
+        )
+        latencies = [time.perf_counter() - start]
+        response.raise_for_status()
+
+        headers = {**headers, "Authorization": f"Bearer {response.json()['access_token']}"}
+        for _ in range(samples):
+            start = time.perf_counter()
+            requests.get(f"{self.base_url}/auth/me", headers=headers).raise_for_status()
+            latencies.append(time.perf_counter() - start)
+            time.sleep(0.25)
+        return latencies
+
+    def attacker(self, attacker_id, stop_at):
+        """Guess admin's password from a rotating pool of addresses until stop_at"""
+        session = requests.Session()
+        attempt = attacker_id
+        while time.perf_counter() < stop_at:
+            ip = attempt % self.attacker_ips
+            attempt += self.attackers
+            response = session.post(
+                f"{self.base_url}/auth/login",
+                json={"username": "admin", "password": f"guess-{attempt}"},
+                headers={"X-Forwarded-For": f"10.66.{ip // 256}.{ip % 256}"}
+            )
+            with self._lock:
+                self.attack_statuses[response.status_code] = (
+                    self.attack_statuses.get(response.status_code, 0) + 1
+                )
+
+    def run(self, name, rate_limits=None):
+        """Measure legitimate latency with and without an attack against one server"""
+        print(f"\n🔍 {name}")
+        process = self.start_server(rate_limits)
+        try:
+            username, headers = self.create_legitimate_user()
+            baseline = self.report("Baseline", self.legitimate_session(username, headers))
+
+            self.attack_statuses = {}
+            stop_at = time.perf_counter() + self.duration
+            with ThreadPoolExecutor(max_workers=self.attackers) as pool:
+                for attacker_id in range(self.attackers):
+                    pool.submit(self.attacker, attacker_id, stop_at)
+                under_attack = self.report(
+                    "Under attack", self.legitimate_session(username, headers)
+                )
+        finally:
+            process.terminate()
+            process.wait()
+
+        total = sum(self.attack_statuses.values())
+        throttled = self.attack_statuses.get(429, 0)
+        print(f"   Attack requests: {total}, throttled: {throttled} "
+              f"({(throttled / total) * 100 if total else 0:.1f}%)")
+        return baseline, under_attack, throttled
+
+    def report(self, name, latencies):
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"   {name}: p50 {p50 * 1000:.0f} ms, p95 {p95 * 1000:.0f} ms")
+        return p95
+
+
+def main():
+    tester = LoginAttackLoadTester()
+    baseline_p95, attack_p95, throttled = tester.run("Rate limiting enabled")
+    control_baseline_p95, control_attack_p95, _ = tester.run(
+        "Rate limiting disabled (control)", rate_limits=NO_RATE_LIMITS
+    )
+
+    print("\n" + "="*50)
+    print("MCSA Circuit 1021 Login Throttling Load Test")
+    print("="*50)
+    print(f"Legitimate p95 under attack: {attack_p95 * 1000:.0f} ms with limiter, "
+          f"{control_attack_p95 * 1000:.0f} ms without "
+          f"(baselines {baseline_p95 * 1000:.0f} / {control_baseline_p95 * 1000:.0f} ms)")
+
+    if not throttled:
+        print("❌ No attack requests were throttled; is rate limiting enabled?")
+        return 1
+    # Legitimate p95 may grow, but should stay within 2x the unloaded p95 (or +50 ms)
+    if attack_p95 > max(2 * baseline_p95, baseline_p95 + 0.05):
+        print("❌ Legitimate latency degraded during the attack.")
+        return 1
+    print("🎉 Legitimate latency held during the attack!")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+BACKEND_DIR = Path(__file__).parent / "backend"
+STARTUP_BUDGET_SECONDS = 1.0
+
+
+class StartupTimer:
+    def __init__(self, runs=5, budget=STARTUP_BUDGET_SECONDS):
+        self.runs = runs
+        self.budget = budget
+        self.results = {}
+
+    def measure_import(self):
+        """Time a cold `import server` in a fresh interpreter"""
+        code = (
+            "import time; start = time.perf_counter(); import server; "
+            "print(time.perf_counter() - start)"
+        )
+        timings = []
+        for _ in range(self.runs):
+            output = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=BACKEND_DIR,
+                capture_output=True,
+                text=True,
+                check=True
+            ).stdout
+            timings.append(float(output.strip().splitlines()[-1]))
+        return timings
+
+    def measure_first_request(self):
+        """Time from launching uvicorn until the first API response"""
+        timings = []
+        for _ in range(self.runs):
+            port = self._free_port()
+            url = f"http://127.0.0.1:{port}/api/auth/me"
+            start = time.perf_counter()
+            process = subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port)],
+                cwd=BACKEND_DIR,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=os.environ.copy()
+            )
+            try:
+                while True:
+                    if process.poll() is not None:
+                        raise RuntimeError("uvicorn exited before serving a request")
+                    try:
+                        # No token, so a running app answers 403 without touching MongoDB
+                        requests.get(url, timeout=0.5)
+                        break
+                    except requests.exceptions.ConnectionError:
+                        time.sleep(0.01)
+                timings.append(time.perf_counter() - start)
+            finally:
+                process.terminate()
+                process.wait()
+        return timings
+
+    def _free_port(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def report(self, name, timings):
+        best = min(timings)
+        worst = max(timings)
+        within_budget = worst <= self.budget
+        self.results[name] = within_budget
+        status = "✅" if within_budget else "❌"
+        print(f"{status} {name}: best {best * 1000:.0f} ms, worst {worst * 1000:.0f} ms "
+              f"(budget {self.budget * 1000:.0f} ms)")
+
+    def print_summary(self):
+        """Print startup summary"""
+        print("\n" + "="*50)
+        print("MCSA Circuit 1021 Startup Time Summary")
+        print("="*50)
+        all_passed = all(self.results.values())
+        if all_passed:
+            print("🎉 Startup within budget!")
+        else:
+            failed = [name for name, passed in self.results.items() if not passed]
+            print(f"❌ Over budget: {', '.join(failed)}")
+        return all_passed
+
+
+def main():
+    timer = StartupTimer()
+
+    # 1. Import time, no .env, database or filesystem access expected
+    timer.report("Import server", timer.measure_import())
+
+    # 2. Time-to-first-request, includes lifespan startup (MongoDB must be reachable)
+    timer.report("First request", timer.measure_first_request())
+
+    return 0 if timer.print_summary() else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 import requests
 import json
+import random
 import sys
+import uuid
 from datetime import datetime
 
 class MCSACircuitTester:
@@ -10,11 +12,21 @@ class MCSACircuitTester:
         self.tests_run = 0
         self.tests_passed = 0
         self.user_data = None
+        self.last_response = None
+        # Fresh client address per run so earlier runs' rate-limit buckets don't interfere
+        self.client_ip = self.random_ip()
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, params=None):
+    def random_ip(self):
+        return f"10.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(1, 254)}"
+
+    def run_test(self, name, method, endpoint, expected_status, data=None, params=None, headers=None):
         """Run a single API test"""
         url = f"{self.base_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
+        headers = {
+            'Content-Type': 'application/json',
+            'X-Forwarded-For': self.client_ip,
+            **(headers or {})
+        }
         if self.token:
             headers['Authorization'] = f'Bearer {self.token}'
 
@@ -30,6 +42,7 @@ class MCSACircuitTester:
                 response = requests.put(url, json=data, headers=headers)
             elif method == 'DELETE':
                 response = requests.delete(url, headers=headers)
+            self.last_response = response
 
             success = response.status_code == expected_status
             if success:
@@ -77,6 +90,23 @@ class MCSACircuitTester:
             200
         )
 
+    def test_bootstrap(self):
+        """Test getting the aggregated bootstrap payload"""
+        success, response = self.run_test(
+            "Bootstrap",
+            "GET",
+            "bootstrap",
+            200
+        )
+        if success:
+            missing = [key for key in ("user", "stats", "members", "finances", "announcements")
+                       if key not in response]
+            if missing:
+                print(f"   Missing keys in bootstrap payload: {', '.join(missing)}")
+                self.tests_passed -= 1
+                return False, response
+        return success, response
+
     def test_dashboard_stats(self):
         """Test getting dashboard statistics"""
         return self.run_test(
@@ -153,6 +183,21 @@ class MCSACircuitTester:
             200
         )
 
+    def test_rate_limit(self, name, endpoint, data, allowed, allowed_status):
+        """Test that the request after the allowed burst is throttled with Retry-After"""
+        headers = {"X-Forwarded-For": self.random_ip()}
+        for _ in range(allowed):
+            self.run_test(f"{name} (within limit)", "POST", endpoint, allowed_status,
+                          data=data, headers=headers)
+
+        success, response = self.run_test(f"{name} (throttled)", "POST", endpoint, 429,
+                                          data=data, headers=headers)
+        if success and not self.last_response.headers.get("Retry-After"):
+            print("   Missing Retry-After header on throttled response")
+            self.tests_passed -= 1
+            return False, response
+        return success, response
+
     def print_summary(self):
         """Print test summary"""
         print("\n" + "="*50)
@@ -181,6 +226,7 @@ def main():
         return 1
     
     tester.test_get_me()
+    tester.test_bootstrap()
     
     # 2. Dashboard Stats Test
     tester.test_dashboard_stats()
@@ -241,6 +287,30 @@ def main():
     # Test getting announcements
     tester.test_get_announcements()
     
+    # 6. Rate Limiting Tests, each from its own client address
+    # Per-account bucket: 10 failed logins for one username
+    tester.test_rate_limit(
+        "Login Throttling",
+        "auth/login",
+        {"username": f"throttle-{uuid.uuid4()}", "password": "wrong"},
+        allowed=10,
+        allowed_status=401
+    )
+
+    # Per-IP bucket: 5 registrations; duplicate username, so no users are created
+    tester.test_rate_limit(
+        "Register Throttling",
+        "auth/register",
+        {
+            "username": "admin",
+            "password": "irrelevant",
+            "full_name": "Throttle Test",
+            "role": "secretary"
+        },
+        allowed=5,
+        allowed_status=400
+    )
+
     # Print summary
     all_passed = tester.print_summary()
     return 0 if all_passed else 1
@@ -1,10 +1,13 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import axios from 'axios';
 import './App.css';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
+// Preloaded bootstrap slices older than this are discarded and the view fetches fresh data
+const BOOTSTRAP_TTL_MS = 30 * 1000;
+
 // Context for authentication
 const AuthContext = React.createContext();
 
@@ -12,6 +15,7 @@ const AuthContext = React.createContext();
 const AuthProvider = ({ children }) => {
   const [user, setUser] = useState(null);
   const [loading, setLoading] = useState(true);
+  const bootstrapRef = useRef({});
 
   useEffect(() => {
     const token = localStorage.getItem('token');
@@ -23,13 +27,47 @@ const AuthProvider = ({ children }) => {
     }
   }, []);
 
+  const fetchBootstrap = async () => {
+    const response = await axios.get(`${API}/bootstrap`);
+    const { user: userData, ...data } = response.data;
+    bootstrapRef.current = { data, fetchedAt: Date.now() };
+    return userData;
+  };
+
+  // Hands out each preloaded slice once, while still fresh, so later visits fetch new data
+  const takeBootstrap = (key) => {
+    const { data = {}, fetchedAt = 0 } = bootstrapRef.current;
+    if (Date.now() - fetchedAt > BOOTSTRAP_TTL_MS) {
+      bootstrapRef.current = {};
+      return undefined;
+    }
+    const slice = data[key];
+    delete data[key];
+    return slice;
+  };
+
+  const clearSession = (error) => {
+    if ([401, 403].includes(error.response?.status)) {
+      localStorage.removeItem('token');
+      delete axios.defaults.headers.common['Authorization'];
+    }
+  };
+
   const fetchCurrentUser = async () => {
     try {
-      const response = await axios.get(`${API}/auth/me`);
-      setUser(response.data);
+      setUser(await fetchBootstrap());
     } catch (error) {
-      localStorage.removeItem('token');
-      delete axios.defaults.headers.common['Authorization'];
+      clearSession(error);
+      if (localStorage.getItem('token')) {
+        // Bootstrap failed for another reason; restore the session and let each view fetch its own data
+        bootstrapRef.current = {};
+        try {
+          const response = await axios.get(`${API}/auth/me`);
+          setUser(response.data);
+        } catch (fallbackError) {
+          clearSession(fallbackError);
+        }
+      }
     } finally {
       setLoading(false);
     }
@@ -42,6 +80,11 @@ const AuthProvider = ({ children }) => {
       
       localStorage.setItem('token', access_token);
       axios.defaults.headers.common['Authorization'] = `Bearer ${access_token}`;
+      try {
+        await fetchBootstrap();
+      } catch (error) {
+        bootstrapRef.current = {};
+      }
       setUser(userData);
       
       return { success: true };
@@ -56,11 +99,12 @@ const AuthProvider = ({ children }) => {
   const logout = () => {
     localStorage.removeItem('token');
     delete axios.defaults.headers.common['Authorization'];
+    bootstrapRef.current = {};
     setUser(null);
   };
 
   return (
-    <AuthContext.Provider value={{ user, login, logout, loading }}>
+    <AuthContext.Provider value={{ user, login, logout, loading, takeBootstrap }}>
       {children}
     </AuthContext.Provider>
   );
@@ -160,12 +204,17 @@ const LoginPage = () => {
 
 // Dashboard Component
 const Dashboard = () => {
-  const { user, logout } = React.useContext(AuthContext);
+  const { user, logout, takeBootstrap } = React.useContext(AuthContext);
   const [activeSection, setActiveSection] = useState('overview');
   const [stats, setStats] = useState(null);
 
   useEffect(() => {
-    fetchDashboardStats();
+    const preloaded = takeBootstrap('stats');
+    if (preloaded) {
+      setStats(preloaded);
+    } else {
+      fetchDashboardStats();
+    }
   }, []);
 
   const fetchDashboardStats = async () => {
@@ -379,6 +428,7 @@ const Dashboard = () => {
 
 // Members Section Component
 const MembersSection = () => {
+  const { takeBootstrap } = React.useContext(AuthContext);
   const [members, setMembers] = useState([]);
   const [showForm, setShowForm] = useState(false);
   const [searchTerm, setSearchTerm] = useState('');
@@ -394,7 +444,12 @@ const MembersSection = () => {
   ];
 
   useEffect(() => {
-    fetchMembers();
+    const preloaded = takeBootstrap('members');
+    if (preloaded && !selectedSociety && !searchTerm) {
+      setMembers(preloaded);
+    } else {
+      fetchMembers();
+    }
   }, [selectedSociety, searchTerm]);
 
   const fetchMembers = async () => {
@@ -636,12 +691,18 @@ const MemberForm = ({ onSave }) => {
 
 // Finances Section Component
 const FinancesSection = ({ societies }) => {
+  const { takeBootstrap } = React.useContext(AuthContext);
   const [showForm, setShowForm] = useState(false);
   const [entries, setEntries] = useState([]);
   const [selectedSociety, setSelectedSociety] = useState('');
 
   useEffect(() => {
-    fetchFinancialEntries();
+    const preloaded = takeBootstrap('finances');
+    if (preloaded && !selectedSociety) {
+      setEntries(preloaded);
+    } else {
+      fetchFinancialEntries();
+    }
   }, [selectedSociety]);
 
   const fetchFinancialEntries = async () => {
@@ -898,11 +959,17 @@ const OrganizationsSection = ({ organizations }) => {
 
 // Announcements Section Component
 const AnnouncementsSection = () => {
+  const { takeBootstrap } = React.useContext(AuthContext);
   const [announcements, setAnnouncements] = useState([]);
   const [showForm, setShowForm] = useState(false);
 
   useEffect(() => {
-    fetchAnnouncements();
+    const preloaded = takeBootstrap('announcements');
+    if (preloaded) {
+      setAnnouncements(preloaded);
+    } else {
+      fetchAnnouncements();
+    }
   }, []);
 
   const fetchAnnouncements = async () => {